@@ -17,6 +17,7 @@ NC='\033[0m' # No Color
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 BIN_DIR="$HOME/.local/bin"
 LIB_DIR="$HOME/.local/lib/brightness-control"
+SYSTEMD_DIR="$HOME/.config/systemd/user"
 
 echo -e "${BLUE}=== Brightness Control Installation ===${NC}\n"
 
@@ -84,13 +85,25 @@ echo "Installing files..."
 
 mkdir -p "$BIN_DIR" "$LIB_DIR"
 
-cp "$SCRIPT_DIR/bin/brightness-control" "$BIN_DIR/"
-chmod +x "$BIN_DIR/brightness-control"
-echo -e "${GREEN}✓${NC} Installed brightness-control → $BIN_DIR"
+cp "$SCRIPT_DIR/bin/brightness-control" "$SCRIPT_DIR/bin/brightness-controld" "$BIN_DIR/"
+chmod +x "$BIN_DIR/brightness-control" "$BIN_DIR/brightness-controld"
+echo -e "${GREEN}✓${NC} Installed brightness-control, brightness-controld → $BIN_DIR"
 
 cp "$SCRIPT_DIR/lib/"*.py "$LIB_DIR/"
 echo -e "${GREEN}✓${NC} Installed library → $LIB_DIR"
 
+# --- Daemon ---
+if command -v systemctl &> /dev/null; then
+    mkdir -p "$SYSTEMD_DIR"
+    cp "$SCRIPT_DIR/systemd/brightness-controld.service" "$SYSTEMD_DIR/"
+    systemctl --user daemon-reload
+    if systemctl --user enable --now brightness-controld.service &> /dev/null; then
+        echo -e "${GREEN}✓${NC} Started brightness-controld (systemd user unit)"
+    else
+        echo -e "${YELLOW}Warning: Could not start brightness-controld; shortcuts will call ddcutil directly${NC}"
+    fi
+fi
+
 # --- i2c group ---
 if ! groups | grep -qw i2c; then
     echo ""
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Brightness daemon and client.
+
+The daemon keeps libddcutil display handles open between keypresses and
+serves brightness requests over a Unix socket, so a keyboard shortcut
+costs one socket round trip instead of a fresh ddcutil launch.
+
+Writes are coalesced: a SET or STEP arms a short timer per bus, and only
+the latest target is written when it fires, so a burst of keypresses
+produces one DDC/CI write instead of one per keypress. A write is never
+held back more than MAX_COALESCE_FACTOR delays, so a held key still
+updates the monitor a few times per second.
+
+Protocol (one request line per connection, reply read until EOF):
+    GET bus=4             ->  OK 40
+    SET bus=4 val=40      ->  OK
+    STEP bus=4 delta=-10  ->  OK 30
+Failures reply "ERR <message>", or "ERR PERM <message>" when the user
+lacks I2C permissions.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional
+
+import libddcutil_ffi
+from ddcutil_wrapper import get_brightness, set_brightness, bus_lock, _extract_bus_number
+
+
+# Socket location (per-user runtime directory)
+SOCKET_PATH = Path(os.getenv('XDG_RUNTIME_DIR', f"/run/user/{os.getuid()}")) / 'brightness.sock'
+
+# systemd user unit that runs the daemon
+SERVICE_NAME = 'brightness-controld.service'
+
+# Re-read brightness on idle handles this often so they don't go stale
+KEEPALIVE_INTERVAL = 25 * 60  # seconds
+
+# How long a write waits for further keypresses before hitting the bus
+COALESCE_MS = 80
+
+# A held key still writes at least every this many coalesce delays
+MAX_COALESCE_FACTOR = 3
+
+# Client-side limit for one request; covers ddcutil retries on a slow bus
+CLIENT_TIMEOUT = 20  # seconds
+
+
+class DaemonUnavailable(Exception):
+    """The daemon socket could not be reached."""
+
+
+class _PendingWrite:
+    """Latest requested brightness for a bus, waiting for its flush timer."""
+
+    def __init__(self, target: int, done: asyncio.Future, timer: asyncio.TimerHandle, deadline: float):
+        self.target = target
+        self.done = done
+        self.timer = timer
+        self.deadline = deadline
+
+
+class BrightnessDaemon:
+    """
+    Serves brightness requests, one worker call per bus at a time.
+
+    Each bus gets its own single-thread executor, so its libddcutil
+    display handle is opened, used and closed on one thread.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path = SOCKET_PATH,
+        coalesce_ms: int = COALESCE_MS,
+        keepalive_interval: float = KEEPALIVE_INTERVAL,
+        fast_path: bool = False,
+    ):
+        self.socket_path = socket_path
+        self.coalesce_delay = coalesce_ms / 1000
+        self.fast_path = fast_path
+        self.keepalive_interval = keepalive_interval
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._last_used: Dict[str, float] = {}
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._writing: Dict[str, int] = {}
+        self._reads: Dict[str, asyncio.Future] = {}
+
+    async def serve(self) -> None:
+        """Listen on the socket until cancelled."""
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        server = await asyncio.start_unix_server(self._handle_client, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+
+        keepalive = asyncio.ensure_future(self._keepalive())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            keepalive.cancel()
+            for executor in self._executors.values():
+                executor.shutdown(wait=False)
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=5)
+            reply = await self._dispatch(line.decode('ascii', 'replace').split())
+        except PermissionError as e:
+            reply = f"ERR PERM {e}"
+        except Exception as e:
+            reply = f"ERR {e}"
+
+        try:
+            writer.write(reply.encode('utf-8') + b'\n')
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, args) -> str:
+        if not args:
+            raise ValueError("Empty request")
+
+        command = args[0].upper()
+        params = dict(arg.split('=', 1) for arg in args[1:] if '=' in arg)
+        if 'bus' not in params:
+            raise ValueError(f"Missing bus= in request: {' '.join(args)}")
+        i2c_bus = f"/dev/i2c-{int(params['bus'])}"
+
+        if command == 'GET':
+            return f"OK {await self._get(i2c_bus)}"
+
+        if command == 'SET':
+            await self._set(i2c_bus, int(params['val']))
+            return "OK"
+
+        if command == 'STEP':
+            current = await self._get(i2c_bus)
+            # Another request may have queued a write while we waited; step
+            # from that. Nothing below awaits until _set() has queued the
+            # target, so concurrent STEPs each see the previous one's value.
+            requested = self._requested(i2c_bus)
+            if requested is not None:
+                current = requested
+            target = min(max(current + int(params['delta']), 0), 100)
+            if target != current:
+                await self._set(i2c_bus, target)
+            return f"OK {target}"
+
+        raise ValueError(f"Unknown command: {command}")
+
+    def _requested(self, i2c_bus: str) -> Optional[int]:
+        """Return the brightness queued or being written for a bus, if any."""
+        pending = self._pending.get(i2c_bus)
+        if pending is not None:
+            return pending.target
+        return self._writing.get(i2c_bus)
+
+    async def _get(self, i2c_bus: str) -> int:
+        """
+        Return the latest requested brightness, or read it from the monitor.
+
+        Concurrent callers share one in-flight read per bus.
+        """
+        requested = self._requested(i2c_bus)
+        if requested is not None:
+            return requested
+
+        read = self._reads.get(i2c_bus)
+        if read is None:
+            read = self._reads[i2c_bus] = asyncio.ensure_future(self._run(i2c_bus, get_brightness, i2c_bus))
+            read.add_done_callback(partial(self._read_done, i2c_bus))
+        return await asyncio.shield(read)
+
+    def _read_done(self, i2c_bus: str, read: asyncio.Future) -> None:
+        if self._reads.get(i2c_bus) is read:
+            del self._reads[i2c_bus]
+
+    async def _set(self, i2c_bus: str, value: int) -> None:
+        """Queue a write and wait until the coalesced value reaches the monitor."""
+        if not 0 <= value <= 100:
+            raise ValueError(f"Brightness value must be 0-100, got {value}")
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(i2c_bus)
+        if pending is None:
+            timer = loop.call_later(self.coalesce_delay, self._start_flush, i2c_bus)
+            deadline = loop.time() + self.coalesce_delay * MAX_COALESCE_FACTOR
+            pending = self._pending[i2c_bus] = _PendingWrite(value, loop.create_future(), timer, deadline)
+        else:
+            # Push the flush back, but not past the deadline set by the
+            # first queued write, so a held key keeps updating the monitor
+            pending.timer.cancel()
+            pending.target = value
+            delay = min(self.coalesce_delay, pending.deadline - loop.time())
+            pending.timer = loop.call_later(max(delay, 0), self._start_flush, i2c_bus)
+
+        await asyncio.shield(pending.done)
+
+    def _start_flush(self, i2c_bus: str) -> None:
+        # Take the write off the queue now, so a request that arrives before
+        # the flush task runs starts a new batch instead of joining this one
+        asyncio.ensure_future(self._flush(i2c_bus, self._pending.pop(i2c_bus)))
+
+    async def _flush(self, i2c_bus: str, pending: _PendingWrite) -> None:
+        self._writing[i2c_bus] = pending.target
+        try:
+            await self._run(i2c_bus, partial(set_brightness, fast_path=self.fast_path), i2c_bus, pending.target)
+        except Exception as e:
+            pending.done.set_exception(e)
+        else:
+            pending.done.set_result(None)
+        finally:
+            if self._writing.get(i2c_bus) == pending.target:
+                del self._writing[i2c_bus]
+
+    async def _run(self, i2c_bus: str, func, *args):
+        """
+        Run a blocking ddcutil call on the bus's worker thread.
+
+        The call holds bus_lock(), so it is also serialized against the
+        CLI and --detect running in other processes.
+        """
+        executor = self._executors.get(i2c_bus)
+        if executor is None:
+            executor = self._executors[i2c_bus] = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"bus{_extract_bus_number(i2c_bus)}"
+            )
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor, partial(_call_locked, i2c_bus, func), *args
+        )
+        self._last_used[i2c_bus] = time.monotonic()
+        return result
+
+    async def _keepalive(self) -> None:
+        """Re-read brightness on idle buses; drop handles that stopped answering."""
+        if not libddcutil_ffi.is_available():
+            return
+
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            now = time.monotonic()
+            for i2c_bus, last_used in list(self._last_used.items()):
+                if now - last_used < self.keepalive_interval:
+                    continue
+                try:
+                    await self._run(i2c_bus, partial(get_brightness, max_retries=1, max_age=0), i2c_bus)
+                except Exception:
+                    try:
+                        await self._run(i2c_bus, libddcutil_ffi.close_display, int(_extract_bus_number(i2c_bus)))
+                    except libddcutil_ffi.DdcError:
+                        pass
+                    self._last_used.pop(i2c_bus, None)
+
+
+def _call_locked(i2c_bus: str, func, *args):
+    """Call func while holding the cross-process lock for a bus."""
+    with bus_lock(i2c_bus):
+        return func(*args)
+
+
+def request(command: str, socket_path: Path = SOCKET_PATH, timeout: float = CLIENT_TIMEOUT) -> str:
+    """
+    Send one request line to the daemon.
+
+    Args:
+        command: Request line, e.g. "GET bus=4".
+        socket_path: Daemon socket path.
+        timeout: Seconds to wait for the reply.
+
+    Returns:
+        Reply payload following "OK" (may be empty).
+
+    Raises:
+        DaemonUnavailable: If the socket cannot be reached. The request
+            was not sent, so it is safe to fall back to a direct call.
+        TimeoutError: If the reply doesn't arrive in time. The daemon
+            may still apply the request.
+        OSError: If the connection fails after the request was sent.
+        PermissionError: If the daemon lacks I2C device permissions.
+        RuntimeError: If the daemon reports any other failure.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as e:
+            raise DaemonUnavailable(f"Brightness daemon not reachable at {socket_path}: {e}") from e
+
+        # From here on the daemon may already have acted on the request, so
+        # failures must not look like "unavailable" to a caller that falls back
+        try:
+            sock.sendall(command.encode('ascii') + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+            reply = b''.join(iter(lambda: sock.recv(4096), b''))
+        except socket.timeout as e:
+            raise TimeoutError(f"No reply from brightness daemon within {timeout} seconds") from e
+
+    status, _, payload = reply.decode('utf-8', 'replace').rstrip('\n').partition(' ')
+    if status == 'OK':
+        return payload
+    if payload.startswith('PERM '):
+        raise PermissionError(payload[len('PERM '):])
+    raise RuntimeError(payload or "Empty reply from brightness daemon")
+
+
+def remote_get_brightness(i2c_bus: str) -> int:
+    """Get brightness for a monitor through the daemon."""
+    return int(request(f"GET bus={_extract_bus_number(i2c_bus)}"))
+
+
+def remote_set_brightness(i2c_bus: str, value: int) -> None:
+    """Set brightness for a monitor through the daemon."""
+    request(f"SET bus={_extract_bus_number(i2c_bus)} val={value}")
+
+
+def remote_step_brightness(i2c_bus: str, delta: int) -> int:
+    """Adjust brightness for a monitor through the daemon; returns the new value."""
+    return int(request(f"STEP bus={_extract_bus_number(i2c_bus)} delta={delta}"))
+
+
+def start_service() -> None:
+    """Ask systemd to start the daemon in the background; errors are ignored."""
+    try:
+        subprocess.run(
+            ['systemctl', '--user', 'start', '--no-block', SERVICE_NAME],
+            capture_output=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        pass
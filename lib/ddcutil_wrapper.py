@@ -1,31 +1,96 @@
 #!/usr/bin/env python3
 """
-ddcutil command wrapper with caching for performance.
+ddcutil wrapper with caching for performance.
 
 Caches the full sorted list of detected monitors to avoid running
-ddcutil detect on every keypress.
+ddcutil detect on every keypress. Brightness reads and writes go through
+libddcutil in-process when the library is installed, and fall back to
+the ddcutil command otherwise.
 """
 
+import atexit
 import json
 import os
 import re
+import shutil
+import struct
 import subprocess
+import threading
 import time
 import fcntl
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List
+
+import i2c_direct
+import libddcutil_ffi
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used without it
+    orjson = None
 
 
 # VCP code for brightness control
 VCP_BRIGHTNESS = 0x10
 
+# Patterns applied to ddcutil output on every keypress
+_CURRENT_VALUE_RE = re.compile(rb'current value\s*=\s*(\d+)')
+_BUS_RE = re.compile(r'i2c-(\d+)')
+# Status names ddcutil prints for garbled or missing DDC/CI replies
+_TRANSFER_ERROR_RE = re.compile(r'DDCRC_(?:DDC_DATA|NULL_RESPONSE|RETRIES)\b')
+
+# Current user, resolved once for cache paths and error messages
+_USER = os.getenv('USER', 'unknown')
+
+# Directory for cache, lock and stats files
+CACHE_DIR = Path("/tmp")
+
 # Cache file location
-CACHE_FILE = Path(f"/tmp/brightness-control-{os.getenv('USER', 'unknown')}-bus-cache.json")
+CACHE_FILE = CACHE_DIR / f"brightness-control-{_USER}-bus-cache.bin"
+
+# How long get_brightness() trusts the last value read or written: long
+# enough to cover a keypress burst, short enough to notice OSD changes
+BRIGHTNESS_TTL = 5  # seconds
+
+# Retry pacing: until a bus has enough recorded latencies, retries wait a
+# flat RETRY_DELAY; afterwards they follow the bus's latency distribution
+RETRY_DELAY = 0.1  # seconds
+MIN_RETRY_DELAY = 0.02  # seconds
+MAX_RETRY_WINDOW = 5.0  # seconds
+LATENCY_HISTORY = 32
+MIN_LATENCY_SAMPLES = 5
+
+# ddcutil --sleep-multiplier per bus: doubled after a failed transfer,
+# halved after a run of successes
+DEFAULT_SLEEP_MULTIPLIER = 0.1
+MIN_SLEEP_MULTIPLIER = 0.05
+MAX_SLEEP_MULTIPLIER = 1.0
+SLEEP_MULTIPLIER_STREAK = 10
+
+# Write a bus's stats file after this many new latency samples (or
+# whenever its sleep multiplier changes), not on every call
+STATS_SAVE_INTERVAL = 8
+
+# Binary cache layout: magic, header (timestamp, monitor count), then per
+# monitor the bus number followed by length-prefixed UTF-8 strings
+CACHE_MAGIC = b"BCAC\x01"
+_CACHE_HEADER = struct.Struct("<dI")
+_CACHE_BUS = struct.Struct("<I")
+_CACHE_STR_LEN = struct.Struct("<H")
 
 
 class MonitorCache:
     """Caches the sorted list of detected monitors with a TTL."""
 
+    # Last decoded cache file, shared by all instances in this process:
+    # (st_mtime_ns, timestamp, monitors)
+    _memo = None
+    _memo_lock = threading.Lock()
+
     def __init__(self, cache_duration: int = 60):
         self.cache_duration = cache_duration
 
@@ -33,62 +98,54 @@ class MonitorCache:
         """
         Return cached monitor list, or None if stale or missing.
 
+        The decoded file is memoized in-process and reused for as long as
+        its mtime is unchanged, so repeated lookups cost a single stat().
+
         Returns:
             List of Monitor objects in sorted order, or None.
         """
         try:
-            if not CACHE_FILE.exists():
-                return None
+            mtime = CACHE_FILE.stat().st_mtime_ns
 
-            with open(CACHE_FILE) as f:
-                data = json.load(f)
+            memo = MonitorCache._memo
+            if memo is not None and memo[0] == mtime:
+                _, timestamp, monitors = memo
+            else:
+                timestamp, monitors = _decode_cache(CACHE_FILE.read_bytes())
+                with MonitorCache._memo_lock:
+                    MonitorCache._memo = (mtime, timestamp, monitors)
 
-            if time.time() - data.get('timestamp', 0) > self.cache_duration:
+            if time.time() - timestamp > self.cache_duration:
                 return None
 
-            # Import here to avoid circular dependency
-            from monitor_detector import Monitor
-            return [
-                Monitor(
-                    manufacturer=m['manufacturer'],
-                    model=m['model'],
-                    serial=m['serial'],
-                    i2c_bus=m['i2c_bus'],
-                    stable_id=m['stable_id'],
-                )
-                for m in data['monitors']
-            ]
+            return list(monitors)
 
-        except (json.JSONDecodeError, OSError, KeyError):
+        except (struct.error, ValueError, OSError):
             return None
 
     def set(self, monitors) -> None:
         """Cache the sorted monitor list."""
         try:
-            data = {
-                'timestamp': time.time(),
-                'monitors': [
-                    {
-                        'stable_id': m.stable_id,
-                        'manufacturer': m.manufacturer,
-                        'model': m.model,
-                        'serial': m.serial,
-                        'i2c_bus': m.i2c_bus,
-                    }
-                    for m in monitors
-                ],
-            }
-            with open(CACHE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-
-        except OSError as e:
+            timestamp = time.time()
+            parts = [CACHE_MAGIC, _CACHE_HEADER.pack(timestamp, len(monitors))]
+            for m in monitors:
+                parts.append(_CACHE_BUS.pack(int(_extract_bus_number(m.i2c_bus))))
+                parts.extend(_pack_str(field) for field in (m.manufacturer, m.model, m.serial, m.stable_id))
+            _write_atomic(CACHE_FILE, b''.join(parts))
+
+            mtime = CACHE_FILE.stat().st_mtime_ns
+            with MonitorCache._memo_lock:
+                MonitorCache._memo = (mtime, timestamp, list(monitors))
+
+        except (struct.error, OSError) as e:
             print(f"Warning: Failed to write cache: {e}")
 
     def invalidate(self) -> None:
         """Delete the cache file."""
+        with MonitorCache._memo_lock:
+            MonitorCache._memo = None
         try:
-            if CACHE_FILE.exists():
-                CACHE_FILE.unlink()
+            CACHE_FILE.unlink()
         except OSError:
             pass
 
@@ -97,7 +154,7 @@ class MonitorCache:
 def bus_lock(i2c_bus: str):
     """File lock to serialize access to the specific I2C bus."""
     bus_num = _extract_bus_number(i2c_bus)
-    lock_file = Path(f"/tmp/brightness-control-{os.getenv('USER', 'unknown')}-bus{bus_num}.lock")
+    lock_file = CACHE_DIR / f"brightness-control-{_USER}-bus{bus_num}.lock"
     
     with open(lock_file, 'w') as f:
         try:
@@ -110,18 +167,15 @@ def bus_lock(i2c_bus: str):
 class BrightnessCache:
     """Caches the current brightness state per I2C bus."""
 
-    def __init__(self, i2c_bus: str, cache_duration: int = 600):
+    def __init__(self, i2c_bus: str, cache_duration: float = 600):
         self.i2c_bus = i2c_bus
         bus_num = _extract_bus_number(i2c_bus)
-        self.cache_file = Path(f"/tmp/brightness-control-{os.getenv('USER', 'unknown')}-bus{bus_num}-brightness.json")
+        self.cache_file = CACHE_DIR / f"brightness-control-{_USER}-bus{bus_num}-brightness.json"
         self.cache_duration = cache_duration
 
     def get(self):
         try:
-            if not self.cache_file.exists():
-                return None
-            with open(self.cache_file) as f:
-                data = json.load(f)
+            data = _read_json(self.cache_file)
             if time.time() - data.get('timestamp', 0) > self.cache_duration:
                 return None
             return data.get('brightness')
@@ -134,26 +188,221 @@ class BrightnessCache:
                 'timestamp': time.time(),
                 'brightness': value
             }
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f)
+            _write_json(self.cache_file, data)
         except OSError:
             pass
 
     def invalidate(self):
         try:
-            if self.cache_file.exists():
-                self.cache_file.unlink()
+            self.cache_file.unlink()
+        except OSError:
+            pass
+
+
+class BusStats:
+    """
+    Per-bus DDC/CI timing state: recent successful call latencies, used to
+    pace retries, and the ddcutil sleep multiplier the bus tolerates.
+    """
+
+    def __init__(self, i2c_bus: str):
+        self.i2c_bus = i2c_bus
+        bus_num = _extract_bus_number(i2c_bus)
+        self.cache_file = CACHE_DIR / f"brightness-control-{_USER}-bus{bus_num}-stats.json"
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self.sleep_multiplier = DEFAULT_SLEEP_MULTIPLIER
+        self.success_streak = 0
+        self._unsaved: List[float] = []
+        self._streak_reset = False
+        self._multiplier_changed = False
+        self._load()
+
+    def _load(self) -> bool:
+        """Replace in-memory state with the stats file; returns False if unreadable."""
+        try:
+            data = _read_json(self.cache_file)
+            latencies = [float(latency) for latency in data['latencies']]
+            sleep_multiplier = float(data['sleep_multiplier'])
+            success_streak = int(data['success_streak'])
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            return False
+
+        self.latencies.clear()
+        self.latencies.extend(latencies)
+        self.sleep_multiplier = sleep_multiplier
+        self.success_streak = success_streak
+        return True
+
+    def _save(self) -> None:
+        """
+        Write the stats file, first folding in whatever other processes
+        (daemon, CLI) saved since this one last read it, so they don't
+        overwrite each other's history.
+        """
+        unsaved = self._unsaved
+        success_streak = self.success_streak
+        sleep_multiplier = self.sleep_multiplier
+        if self._load():
+            self.latencies.extend(unsaved)
+            if self._streak_reset:
+                self.success_streak = success_streak
+            else:
+                self.success_streak += len(unsaved)
+            if self._multiplier_changed:
+                self.sleep_multiplier = sleep_multiplier
+        self._unsaved = []
+        self._streak_reset = False
+        self._multiplier_changed = False
+
+        try:
+            data = {
+                'latencies': list(self.latencies),
+                'sleep_multiplier': self.sleep_multiplier,
+                'success_streak': self.success_streak,
+            }
+            _write_json(self.cache_file, data)
         except OSError:
             pass
 
+    @property
+    def has_unsaved(self) -> bool:
+        """True if this process recorded anything not yet in the stats file."""
+        return bool(self._unsaved) or self._streak_reset or self._multiplier_changed
+
+    def _set_sleep_multiplier(self, multiplier: float) -> None:
+        if multiplier != self.sleep_multiplier:
+            self.sleep_multiplier = multiplier
+            self._multiplier_changed = True
+
+    def record_success(self, latency: float) -> None:
+        """Add a successful call's latency; relax the sleep multiplier after a streak."""
+        self.latencies.append(latency)
+        self._unsaved.append(latency)
+        self.success_streak += 1
+        if self.success_streak >= SLEEP_MULTIPLIER_STREAK:
+            self._set_sleep_multiplier(max(self.sleep_multiplier / 2, MIN_SLEEP_MULTIPLIER))
+            self.success_streak = 0
+            self._streak_reset = True
+        if self._multiplier_changed or len(self._unsaved) >= STATS_SAVE_INTERVAL:
+            self._save()
+
+    def record_failure(self) -> None:
+        """Note a timed-out or corrupted transfer; back the sleep multiplier off."""
+        self._set_sleep_multiplier(min(self.sleep_multiplier * 2, MAX_SLEEP_MULTIPLIER))
+        self.success_streak = 0
+        self._streak_reset = True
+        if self._multiplier_changed:
+            self._save()
+
+    def retry_delays(self, max_retries: int) -> List[float]:
+        """
+        Return how long to sleep before each retry.
+
+        Retry i of n is placed at the i/n quantile of the recorded
+        latencies (capped at MAX_RETRY_WINDOW), so a fast monitor is
+        retried quickly and a slow one isn't polled before it could
+        have answered.
+        """
+        retries = max_retries - 1
+        if retries <= 0:
+            return []
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return [RETRY_DELAY] * retries
+
+        ordered = sorted(self.latencies)
+        delays = []
+        previous = 0.0
+        for i in range(1, retries + 1):
+            point = min(ordered[round(i / retries * (len(ordered) - 1))], MAX_RETRY_WINDOW)
+            delays.append(max(point - previous, MIN_RETRY_DELAY))
+            previous = max(point, previous)
+        return delays
+
+
+_bus_stats: Dict[str, BusStats] = {}
+_bus_stats_lock = threading.Lock()
+
+
+def _get_bus_stats(i2c_bus: str) -> BusStats:
+    """Return the process-wide BusStats for a bus, loading it on first use."""
+    with _bus_stats_lock:
+        stats = _bus_stats.get(i2c_bus)
+        if stats is None:
+            stats = _bus_stats[i2c_bus] = BusStats(i2c_bus)
+        return stats
+
 
-def get_brightness(i2c_bus: str, max_retries: int = 3) -> int:
+@atexit.register
+def _save_bus_stats() -> None:
+    """
+    Write out stats still pending at exit.
+
+    BusStats batches its writes, but the CLI runs one process per
+    keypress and records only a sample or two, so without this nothing
+    it learns would reach the next process.
+    """
+    with _bus_stats_lock:
+        pending = [stats for stats in _bus_stats.values() if stats.has_unsaved]
+    for stats in pending:
+        stats._save()
+
+
+def run_ddcutil(args: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run ddcutil with the given arguments via subprocess.run().
+
+    ddcutil is resolved to an absolute path once, and descriptors are not
+    closed in the child (Python opens them non-inheritable anyway). Both
+    are preconditions for subprocess to launch it with posix_spawn rather
+    than fork+exec, which matters once the calling process (daemon, UI)
+    has grown.
+
+    Raises:
+        FileNotFoundError: If ddcutil is not installed.
+        subprocess.TimeoutExpired: If a timeout is given and exceeded.
+    """
+    return subprocess.run([_ddcutil_path(), *args], close_fds=False, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _ddcutil_path() -> str:
+    path = shutil.which('ddcutil')
+    if path is None:
+        raise FileNotFoundError("ddcutil")
+    return path
+
+
+_bus_thread_locks: Dict[str, threading.Lock] = {}
+_bus_thread_locks_guard = threading.Lock()
+
+
+def _bus_thread_lock(i2c_bus: str) -> threading.Lock:
+    """
+    Return the in-process lock for a bus.
+
+    Serializes get/set calls from threads in one process; bus_lock()
+    serializes across processes.
+    """
+    bus_num = _extract_bus_number(i2c_bus)
+    with _bus_thread_locks_guard:
+        lock = _bus_thread_locks.get(bus_num)
+        if lock is None:
+            lock = _bus_thread_locks[bus_num] = threading.Lock()
+        return lock
+
+
+def get_brightness(i2c_bus: str, max_retries: int = 3, max_age: float = BRIGHTNESS_TTL) -> int:
     """
     Get current brightness level for a monitor.
 
+    A value read or written within the last max_age seconds is returned
+    from the bus's BrightnessCache without an I2C round trip.
+
     Args:
         i2c_bus: I2C bus path (e.g., "/dev/i2c-4").
         max_retries: Number of retry attempts for transient failures.
+        max_age: Oldest cached value to accept, in seconds; 0 always
+            reads the monitor.
 
     Returns:
         Current brightness value (0-100).
@@ -162,24 +411,125 @@ def get_brightness(i2c_bus: str, max_retries: int = 3) -> int:
         RuntimeError: If ddcutil command fails after retries.
         PermissionError: If user lacks I2C device permissions.
     """
+    with _bus_thread_lock(i2c_bus):
+        b_cache = BrightnessCache(i2c_bus, cache_duration=max_age)
+        if max_age > 0:
+            cached = b_cache.get()
+            if cached is not None:
+                return cached
+
+        value = _read_brightness(i2c_bus, max_retries)
+        b_cache.set(value)
+        return value
+
+
+def set_brightness(
+    i2c_bus: str,
+    value: int,
+    max_retries: int = 3,
+    verify: bool = False,
+    fast_path: bool = False,
+) -> None:
+    """
+    Set brightness level for a monitor.
+
+    On success the new value is recorded in the bus's BrightnessCache.
+
+    Args:
+        i2c_bus: I2C bus path (e.g., "/dev/i2c-4").
+        value: Target brightness value (0-100).
+        max_retries: Number of retry attempts for transient failures.
+        verify: Read the value back after writing it. Off by default since
+            it doubles the I2C traffic per keypress; useful for debugging.
+        fast_path: Write the DDC/CI packet straight to /dev/i2c-N first,
+            falling back to libddcutil/ddcutil if that fails. Ignored
+            when verify is set.
+
+    Raises:
+        ValueError: If value is out of range.
+        RuntimeError: If ddcutil command fails after retries.
+        PermissionError: If user lacks I2C device permissions.
+    """
+    if not 0 <= value <= 100:
+        raise ValueError(f"Brightness value must be 0-100, got {value}")
+
+    with _bus_thread_lock(i2c_bus):
+        _write_brightness(i2c_bus, value, max_retries, verify, fast_path)
+        BrightnessCache(i2c_bus).set(value)
+
+
+def prime_brightness_cache(monitors) -> Dict[str, int]:
+    """
+    Read every monitor's brightness concurrently and cache it per bus.
+
+    Each monitor sits on its own I2C bus, so the reads can run in parallel
+    and a multi-monitor probe costs about as much as the slowest monitor.
+    Monitors that fail to answer are left out.
+
+    Args:
+        monitors: Monitor objects from detect_monitors().
+
+    Returns:
+        Mapping of I2C bus path to brightness value.
+
+    Raises:
+        PermissionError: If user lacks I2C device permissions.
+    """
+    def read(monitor) -> int:
+        with bus_lock(monitor.i2c_bus):
+            try:
+                return get_brightness(monitor.i2c_bus, max_age=0)
+            finally:
+                # The pool thread is about to go away, and libddcutil
+                # handles must be closed on the thread that opened them
+                try:
+                    libddcutil_ffi.close_display(int(_extract_bus_number(monitor.i2c_bus)))
+                except libddcutil_ffi.DdcError:
+                    pass
+
+    if not monitors:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(monitors)) as pool:
+        futures = [(monitor, pool.submit(read, monitor)) for monitor in monitors]
+        for monitor, future in futures:
+            try:
+                results[monitor.i2c_bus] = future.result()
+            except PermissionError:
+                raise
+            except (RuntimeError, OSError):
+                pass
+    return results
+
+
+def _read_brightness(i2c_bus: str, max_retries: int) -> int:
+    """Read brightness from the monitor via libddcutil or the ddcutil command."""
     bus_num = _extract_bus_number(i2c_bus)
 
+    if libddcutil_ffi.is_available():
+        return _get_brightness_lib(i2c_bus, int(bus_num), max_retries)
+
+    stats = _get_bus_stats(i2c_bus)
+    delays = stats.retry_delays(max_retries)
+
     for attempt in range(max_retries):
         try:
-            result = subprocess.run(
-                ['ddcutil', '--sleep-multiplier', '.1', '--bus', bus_num, 'getvcp', hex(VCP_BRIGHTNESS)],
+            started = time.monotonic()
+            result = run_ddcutil(
+                ['--sleep-multiplier', str(stats.sleep_multiplier), '--bus', bus_num, 'getvcp', hex(VCP_BRIGHTNESS)],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
 
             if result.returncode != 0:
-                stderr = result.stderr.lower()
+                stderr_text = result.stderr.decode('ascii', 'replace')
+                stderr = stderr_text.lower()
 
                 if 'permission denied' in stderr or 'errno 13' in stderr:
                     raise PermissionError(
                         f"Permission denied accessing {i2c_bus}. "
-                        f"Add user to i2c group: sudo usermod -aG i2c {os.getenv('USER')}\n"
+                        f"Add user to i2c group: sudo usermod -aG i2c {_USER}\n"
                         f"Then log out and log back in."
                     )
 
@@ -189,19 +539,25 @@ def get_brightness(i2c_bus: str, max_retries: int = 3) -> int:
                         f"(VCP {hex(VCP_BRIGHTNESS)})"
                     )
 
+                if _TRANSFER_ERROR_RE.search(stderr_text):
+                    stats.record_failure()
                 if attempt < max_retries - 1:
-                    time.sleep(0.1)
+                    time.sleep(delays[attempt])
                     continue
 
-                raise RuntimeError(f"ddcutil getvcp failed: {result.stderr.strip()}")
+                raise RuntimeError(f"ddcutil getvcp failed: {stderr_text.strip()}")
 
-            match = re.search(r'current value\s*=\s*(\d+)', result.stdout)
+            match = _CURRENT_VALUE_RE.search(result.stdout)
             if match:
+                stats.record_success(time.monotonic() - started)
                 return int(match.group(1))
 
-            raise RuntimeError(f"Failed to parse brightness from: {result.stdout.strip()}")
+            raise RuntimeError(
+                f"Failed to parse brightness from: {result.stdout.decode('ascii', 'replace').strip()}"
+            )
 
         except subprocess.TimeoutExpired:
+            stats.record_failure()
             if attempt < max_retries - 1:
                 continue
             raise RuntimeError(f"ddcutil getvcp timed out on {i2c_bus}")
@@ -212,53 +568,59 @@ def get_brightness(i2c_bus: str, max_retries: int = 3) -> int:
     raise RuntimeError("Failed to get brightness after retries")
 
 
-def set_brightness(i2c_bus: str, value: int, max_retries: int = 3) -> None:
-    """
-    Set brightness level for a monitor.
+def _write_brightness(i2c_bus: str, value: int, max_retries: int, verify: bool, fast_path: bool) -> None:
+    """Write brightness to the monitor via i2c-dev, libddcutil or the ddcutil command."""
+    bus_num = _extract_bus_number(i2c_bus)
 
-    Args:
-        i2c_bus: I2C bus path (e.g., "/dev/i2c-4").
-        value: Target brightness value (0-100).
-        max_retries: Number of retry attempts for transient failures.
+    if fast_path and not verify:
+        try:
+            i2c_direct.set_vcp_value(int(bus_num), VCP_BRIGHTNESS, value)
+            return
+        except OSError:
+            pass
 
-    Raises:
-        ValueError: If value is out of range.
-        RuntimeError: If ddcutil command fails after retries.
-        PermissionError: If user lacks I2C device permissions.
-    """
-    if not 0 <= value <= 100:
-        raise ValueError(f"Brightness value must be 0-100, got {value}")
+    if libddcutil_ffi.is_available():
+        _set_brightness_lib(i2c_bus, int(bus_num), value, max_retries, verify)
+        return
 
-    bus_num = _extract_bus_number(i2c_bus)
+    verify_args = [] if verify else ['--noverify']
+    stats = _get_bus_stats(i2c_bus)
+    delays = stats.retry_delays(max_retries)
 
     for attempt in range(max_retries):
         try:
-            result = subprocess.run(
-                ['ddcutil', '--noverify', '--sleep-multiplier', '.1', '--bus', bus_num, 'setvcp', hex(VCP_BRIGHTNESS), str(value)],
-                capture_output=True,
-                text=True,
+            started = time.monotonic()
+            result = run_ddcutil(
+                [*verify_args, '--sleep-multiplier', str(stats.sleep_multiplier), '--bus', bus_num, 'setvcp', hex(VCP_BRIGHTNESS), str(value)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=5,
             )
 
             if result.returncode != 0:
-                stderr = result.stderr.lower()
+                stderr_text = result.stderr.decode('ascii', 'replace')
+                stderr = stderr_text.lower()
 
                 if 'permission denied' in stderr or 'errno 13' in stderr:
                     raise PermissionError(
                         f"Permission denied accessing {i2c_bus}. "
-                        f"Add user to i2c group: sudo usermod -aG i2c {os.getenv('USER')}\n"
+                        f"Add user to i2c group: sudo usermod -aG i2c {_USER}\n"
                         f"Then log out and log back in."
                     )
 
+                if _TRANSFER_ERROR_RE.search(stderr_text):
+                    stats.record_failure()
                 if attempt < max_retries - 1:
-                    time.sleep(0.1)
+                    time.sleep(delays[attempt])
                     continue
 
-                raise RuntimeError(f"ddcutil setvcp failed: {result.stderr.strip()}")
+                raise RuntimeError(f"ddcutil setvcp failed: {stderr_text.strip()}")
 
+            stats.record_success(time.monotonic() - started)
             return
 
         except subprocess.TimeoutExpired:
+            stats.record_failure()
             if attempt < max_retries - 1:
                 continue
             raise RuntimeError(f"ddcutil setvcp timed out on {i2c_bus}")
@@ -269,9 +631,162 @@ def set_brightness(i2c_bus: str, value: int, max_retries: int = 3) -> None:
     raise RuntimeError("Failed to set brightness after retries")
 
 
+def _get_brightness_lib(i2c_bus: str, bus: int, max_retries: int) -> int:
+    """Read brightness in-process through libddcutil."""
+    stats = _get_bus_stats(i2c_bus)
+    delays = stats.retry_delays(max_retries)
+
+    for attempt in range(max_retries):
+        try:
+            started = time.monotonic()
+            libddcutil_ffi.set_sleep_multiplier(stats.sleep_multiplier)
+            value = libddcutil_ffi.get_vcp_value(bus, VCP_BRIGHTNESS)
+            stats.record_success(time.monotonic() - started)
+            return value
+        except libddcutil_ffi.DdcError as e:
+            _raise_for_status(i2c_bus, e)
+            if e.status in libddcutil_ffi.TRANSFER_STATUSES:
+                stats.record_failure()
+            if attempt < max_retries - 1:
+                time.sleep(delays[attempt])
+                continue
+            raise RuntimeError(f"libddcutil getvcp failed on {i2c_bus}: {e}") from e
+
+    raise RuntimeError("Failed to get brightness after retries")
+
+
+def _set_brightness_lib(i2c_bus: str, bus: int, value: int, max_retries: int, verify: bool) -> None:
+    """Write brightness in-process through libddcutil."""
+    stats = _get_bus_stats(i2c_bus)
+    delays = stats.retry_delays(max_retries)
+
+    for attempt in range(max_retries):
+        try:
+            started = time.monotonic()
+            libddcutil_ffi.set_sleep_multiplier(stats.sleep_multiplier)
+            libddcutil_ffi.set_vcp_value(bus, VCP_BRIGHTNESS, value, verify)
+            stats.record_success(time.monotonic() - started)
+            return
+        except libddcutil_ffi.DdcError as e:
+            _raise_for_status(i2c_bus, e)
+            if e.status in libddcutil_ffi.TRANSFER_STATUSES:
+                stats.record_failure()
+            if attempt < max_retries - 1:
+                time.sleep(delays[attempt])
+                continue
+            raise RuntimeError(f"libddcutil setvcp failed on {i2c_bus}: {e}") from e
+
+    raise RuntimeError("Failed to set brightness after retries")
+
+
+def _raise_for_status(i2c_bus: str, error: libddcutil_ffi.DdcError) -> None:
+    """Map non-retryable libddcutil status codes to the errors ddcutil output would produce."""
+    if error.status in libddcutil_ffi.PERMISSION_STATUSES:
+        raise PermissionError(
+            f"Permission denied accessing {i2c_bus}. "
+            f"Add user to i2c group: sudo usermod -aG i2c {_USER}\n"
+            f"Then log out and log back in."
+        ) from error
+
+    if error.status in libddcutil_ffi.UNSUPPORTED_STATUSES:
+        raise RuntimeError(
+            f"Monitor on {i2c_bus} does not support DDC/CI brightness control "
+            f"(VCP {hex(VCP_BRIGHTNESS)})"
+        ) from error
+
+
+def _read_json(path: Path):
+    """Load a small JSON cache file from raw bytes, using orjson if installed."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_json(path: Path, data) -> None:
+    """Write a small JSON cache file compactly, using orjson if installed."""
+    _write_atomic(path, orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8'))
+
+
+def _write_atomic(path: Path, raw: bytes) -> None:
+    """
+    Replace a cache file's contents.
+
+    The data goes to a temporary file that is then renamed over the
+    target, so concurrent readers never see a partial file.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(raw)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _decode_cache(raw: bytes):
+    """
+    Decode a binary monitor cache file.
+
+    Returns:
+        Tuple of (timestamp, list of Monitor objects).
+
+    Raises:
+        ValueError, struct.error: If the data is not a valid cache file.
+    """
+    data = memoryview(raw)
+    if data[:len(CACHE_MAGIC)] != CACHE_MAGIC:
+        raise ValueError("Not a monitor cache file")
+    offset = len(CACHE_MAGIC)
+
+    timestamp, count = _CACHE_HEADER.unpack_from(data, offset)
+    offset += _CACHE_HEADER.size
+
+    # Import here to avoid circular dependency
+    from monitor_detector import Monitor
+    monitors = []
+    for _ in range(count):
+        (bus,) = _CACHE_BUS.unpack_from(data, offset)
+        offset += _CACHE_BUS.size
+        manufacturer, offset = _unpack_str(data, offset)
+        model, offset = _unpack_str(data, offset)
+        serial, offset = _unpack_str(data, offset)
+        stable_id, offset = _unpack_str(data, offset)
+        monitors.append(Monitor(
+            manufacturer=manufacturer,
+            model=model,
+            serial=serial,
+            i2c_bus=f"/dev/i2c-{bus}",
+            stable_id=stable_id,
+        ))
+    return timestamp, monitors
+
+
+def _pack_str(value: str) -> bytes:
+    """Encode a string as a 2-byte length followed by UTF-8 bytes."""
+    encoded = value.encode('utf-8')
+    return _CACHE_STR_LEN.pack(len(encoded)) + encoded
+
+
+def _unpack_str(data: memoryview, offset: int):
+    """Decode a length-prefixed string; returns (value, next offset)."""
+    (length,) = _CACHE_STR_LEN.unpack_from(data, offset)
+    offset += _CACHE_STR_LEN.size
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated cache file")
+    return str(data[offset:end], 'utf-8'), end
+
+
 def _extract_bus_number(i2c_bus: str) -> str:
     """Extract numeric bus number from an I2C bus path like '/dev/i2c-4'."""
-    match = re.search(r'i2c-(\d+)', i2c_bus)
+    # Fast path for the usual "/dev/i2c-<digits>" form
+    head, _, tail = i2c_bus.rpartition('-')
+    if head.endswith('i2c') and tail.isdigit() and tail.isascii():
+        return tail
+
+    match = _BUS_RE.search(i2c_bus)
     if match:
         return match.group(1)
     raise ValueError(f"Invalid I2C bus format: {i2c_bus}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Direct DDC/CI writes through the Linux i2c-dev interface.
+
+Sends the 7-byte DDC/CI "Set VCP Feature" packet straight to the
+monitor at I2C address 0x37, skipping ddcutil and libddcutil entirely.
+Only writes are supported; detection and reads stay with ddcutil. Each
+bus's device file is opened once and kept for the life of the process.
+"""
+
+import fcntl
+import os
+import threading
+import time
+from typing import Dict
+
+
+# ioctl request to set the slave address on an i2c-dev file (linux/i2c-dev.h)
+I2C_SLAVE = 0x0703
+
+# DDC/CI addressing: the monitor listens at 0x37 (0x6E as a write address),
+# and the host identifies itself as source address 0x51
+DDC_ADDRESS = 0x37
+DDC_DEST_WRITE = 0x6E
+DDC_HOST_ADDRESS = 0x51
+
+# Set VCP Feature opcode, and the length byte for its 4-byte payload
+DDC_SET_VCP = 0x03
+DDC_SET_VCP_LENGTH = 0x80 | 4
+
+# Minimum gap the DDC/CI spec asks for between commands to one monitor
+DDC_WRITE_INTERVAL = 0.05  # seconds
+
+_fds: Dict[int, int] = {}
+_last_write: Dict[int, float] = {}
+_fds_lock = threading.Lock()
+
+
+def _get_fd(bus: int) -> int:
+    """Return the open i2c-dev descriptor for a bus, opening it on first use."""
+    with _fds_lock:
+        fd = _fds.get(bus)
+        if fd is None:
+            fd = os.open(f"/dev/i2c-{bus}", os.O_RDWR)
+            try:
+                fcntl.ioctl(fd, I2C_SLAVE, DDC_ADDRESS)
+            except OSError:
+                os.close(fd)
+                raise
+            _fds[bus] = fd
+        return fd
+
+
+def close_bus(bus: int) -> None:
+    """Close and forget the cached descriptor for a bus, if any."""
+    with _fds_lock:
+        fd = _fds.pop(bus, None)
+    if fd is not None:
+        os.close(fd)
+
+
+def set_vcp_packet(feature_code: int, value: int) -> bytes:
+    """
+    Build a DDC/CI Set VCP Feature packet.
+
+    The checksum is the XOR of the destination address (0x6E) and every
+    preceding byte of the packet.
+    """
+    packet = bytearray([
+        DDC_HOST_ADDRESS,
+        DDC_SET_VCP_LENGTH,
+        DDC_SET_VCP,
+        feature_code,
+        (value >> 8) & 0xFF,
+        value & 0xFF,
+    ])
+    checksum = DDC_DEST_WRITE
+    for byte in packet:
+        checksum ^= byte
+    packet.append(checksum)
+    return bytes(packet)
+
+
+def set_vcp_value(bus: int, feature_code: int, value: int) -> None:
+    """
+    Write a non-table VCP feature value directly over I2C.
+
+    Args:
+        bus: I2C bus number (e.g., 4 for /dev/i2c-4).
+        feature_code: VCP feature code (e.g., 0x10 for brightness).
+        value: New feature value (0-65535).
+
+    Raises:
+        OSError: If the device can't be opened or the write fails. The
+            cached descriptor is closed so the next call reopens it.
+    """
+    fd = _get_fd(bus)
+    packet = set_vcp_packet(feature_code, value)
+
+    wait = _last_write.get(bus, 0.0) + DDC_WRITE_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+
+    try:
+        os.write(fd, packet)
+    except OSError:
+        close_bus(bus)
+        raise
+    finally:
+        _last_write[bus] = time.monotonic()
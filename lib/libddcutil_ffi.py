@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+In-process DDC/CI access through libddcutil.
+
+Calls the ddcutil shared library via ctypes instead of launching the
+ddcutil binary, so a brightness read or write costs one I2C transaction
+rather than a process start, display probe and text parse. Display
+handles are opened once per I2C bus and kept for the life of the process.
+
+libddcutil ties a display's lock to the thread that opened it, so each
+bus's handle must be used and closed from the thread that opened it.
+"""
+
+import ctypes
+import errno
+import threading
+from typing import Callable, Dict, Optional
+
+
+# Shared library names, newest API first (ddcutil 2.x ships .so.5)
+LIBDDCUTIL_NAMES = ('libddcutil.so.5', 'libddcutil.so.4')
+
+# Status codes from ddcutil_status_codes.h
+DDCRC_OK = 0
+DDCRC_DDC_DATA = -3001
+DDCRC_NULL_RESPONSE = -3002
+DDCRC_REPORTED_UNSUPPORTED = -3005
+DDCRC_RETRIES = -3010
+DDCRC_DETERMINED_UNSUPPORTED = -3015
+DDCRC_INVALID_DISPLAY = -3023
+
+# libddcutil reports OS failures as negative errno values
+PERMISSION_STATUSES = (-errno.EACCES, -errno.EPERM)
+UNSUPPORTED_STATUSES = (DDCRC_REPORTED_UNSUPPORTED, DDCRC_DETERMINED_UNSUPPORTED)
+# Garbled or missing replies, worth backing the sleep multiplier off for
+TRANSFER_STATUSES = (DDCRC_DDC_DATA, DDCRC_NULL_RESPONSE, DDCRC_RETRIES)
+# Failures after which the cached display handle is dropped and reopened
+INVALIDATING_STATUSES = (DDCRC_DDC_DATA, DDCRC_INVALID_DISPLAY)
+
+
+class DdcError(RuntimeError):
+    """A libddcutil call returned a non-zero status code."""
+
+    def __init__(self, function: str, status: int):
+        self.function = function
+        self.status = status
+        super().__init__(f"{function} failed: {status_name(status)} ({status})")
+
+
+class _NonTableVcpValue(ctypes.Structure):
+    """Mirror of DDCA_Non_Table_Vcp_Value."""
+    _fields_ = [
+        ('mh', ctypes.c_uint8),
+        ('ml', ctypes.c_uint8),
+        ('sh', ctypes.c_uint8),
+        ('sl', ctypes.c_uint8),
+    ]
+
+
+_lib: Optional[ctypes.CDLL] = None
+# ddca_get_display_ref, or ddca_create_display_ref before ddcutil 2.x
+_get_display_ref: Optional[Callable[..., int]] = None
+_load_attempted = False
+_handles: Dict[int, ctypes.c_void_p] = {}
+_handles_lock = threading.Lock()
+
+
+def _load() -> Optional[ctypes.CDLL]:
+    """Load libddcutil and declare the function signatures we use."""
+    global _lib, _get_display_ref, _load_attempted
+    if _load_attempted:
+        return _lib
+    _load_attempted = True
+
+    for name in LIBDDCUTIL_NAMES:
+        try:
+            lib = ctypes.CDLL(name)
+            get_ref = _declare(lib)
+        except (OSError, AttributeError):
+            # Missing library, or a build lacking one of the symbols we bind
+            continue
+
+        _lib = lib
+        _get_display_ref = get_ref
+        break
+
+    return _lib
+
+
+def _declare(lib: ctypes.CDLL):
+    """
+    Declare the function signatures we use on a loaded library.
+
+    Returns:
+        The display-ref lookup function for this library version.
+
+    Raises:
+        AttributeError: If the library lacks a required symbol.
+    """
+    void_p = ctypes.c_void_p
+    lib.ddca_create_busno_display_identifier.argtypes = [ctypes.c_int, ctypes.POINTER(void_p)]
+    lib.ddca_create_busno_display_identifier.restype = ctypes.c_int
+    lib.ddca_free_display_identifier.argtypes = [void_p]
+    lib.ddca_free_display_identifier.restype = ctypes.c_int
+    lib.ddca_open_display2.argtypes = [void_p, ctypes.c_bool, ctypes.POINTER(void_p)]
+    lib.ddca_open_display2.restype = ctypes.c_int
+    lib.ddca_close_display.argtypes = [void_p]
+    lib.ddca_close_display.restype = ctypes.c_int
+    lib.ddca_get_non_table_vcp_value.argtypes = [void_p, ctypes.c_uint8, ctypes.POINTER(_NonTableVcpValue)]
+    lib.ddca_get_non_table_vcp_value.restype = ctypes.c_int
+    lib.ddca_set_non_table_vcp_value.argtypes = [void_p, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+    lib.ddca_set_non_table_vcp_value.restype = ctypes.c_int
+    lib.ddca_rc_name.argtypes = [ctypes.c_int]
+    lib.ddca_rc_name.restype = ctypes.c_char_p
+    lib.ddca_enable_verify.argtypes = [ctypes.c_bool]
+    lib.ddca_enable_verify.restype = ctypes.c_bool
+    # Deprecated in ddcutil 2.x, so optional
+    set_multiplier = getattr(lib, 'ddca_set_sleep_multiplier', None)
+    if set_multiplier is not None:
+        set_multiplier.argtypes = [ctypes.c_double]
+        set_multiplier.restype = ctypes.c_double
+
+    # ddcutil 2.x renamed ddca_create_display_ref to ddca_get_display_ref
+    get_ref = getattr(lib, 'ddca_get_display_ref', None) or lib.ddca_create_display_ref
+    get_ref.argtypes = [void_p, ctypes.POINTER(void_p)]
+    get_ref.restype = ctypes.c_int
+    return get_ref
+
+
+def is_available() -> bool:
+    """Return True if libddcutil could be loaded."""
+    return _load() is not None
+
+
+def status_name(status: int) -> str:
+    """Return the symbolic name of a libddcutil status code."""
+    lib = _load()
+    if lib is not None:
+        name = lib.ddca_rc_name(status)
+        if name:
+            return name.decode('ascii', 'replace')
+    return str(status)
+
+
+def _check(function: str, status: int, bus: Optional[int] = None) -> None:
+    if status != DDCRC_OK:
+        if bus is not None and status in INVALIDATING_STATUSES:
+            try:
+                close_display(bus)
+            except DdcError:
+                pass  # report the failure that got us here instead
+        raise DdcError(function, status)
+
+
+def _require() -> ctypes.CDLL:
+    lib = _load()
+    if lib is None:
+        raise RuntimeError("libddcutil not available")
+    return lib
+
+
+def _open_display(bus: int) -> ctypes.c_void_p:
+    """Open a display handle for an I2C bus number."""
+    lib = _require()
+    get_ref = _get_display_ref
+    if get_ref is None:
+        raise RuntimeError("libddcutil not available")
+
+    did = ctypes.c_void_p()
+    _check('ddca_create_busno_display_identifier',
+           lib.ddca_create_busno_display_identifier(bus, ctypes.byref(did)))
+    try:
+        dref = ctypes.c_void_p()
+        _check('ddca_get_display_ref', get_ref(did, ctypes.byref(dref)))
+        handle = ctypes.c_void_p()
+        _check('ddca_open_display2', lib.ddca_open_display2(dref, True, ctypes.byref(handle)))
+        return handle
+    finally:
+        lib.ddca_free_display_identifier(did)
+
+
+def _get_handle(bus: int) -> ctypes.c_void_p:
+    """
+    Return the cached display handle for a bus, opening it on first use.
+
+    The open itself runs outside _handles_lock, so a monitor that is slow
+    to answer doesn't hold up the other buses. Callers serialize calls
+    per bus, so two threads never open the same bus at once.
+    """
+    with _handles_lock:
+        handle = _handles.get(bus)
+    if handle is not None:
+        return handle
+
+    handle = _open_display(bus)
+    with _handles_lock:
+        _handles[bus] = handle
+    return handle
+
+
+def close_display(bus: int) -> None:
+    """
+    Close and forget the cached display handle for a bus, if any.
+
+    Raises:
+        DdcError: If libddcutil fails to close the handle. It is
+            forgotten either way.
+    """
+    with _handles_lock:
+        handle = _handles.pop(bus, None)
+    if handle is not None and _lib is not None:
+        _check('ddca_close_display', _lib.ddca_close_display(handle))
+
+
+def set_sleep_multiplier(multiplier: float) -> None:
+    """
+    Scale libddcutil's DDC/CI sleep times for calls made from this thread.
+
+    Does nothing if the library no longer exports ddca_set_sleep_multiplier.
+    """
+    set_multiplier = getattr(_require(), 'ddca_set_sleep_multiplier', None)
+    if set_multiplier is not None:
+        set_multiplier(multiplier)
+
+
+def get_vcp_value(bus: int, feature_code: int) -> int:
+    """
+    Read the current value of a non-table VCP feature.
+
+    Args:
+        bus: I2C bus number (e.g., 4 for /dev/i2c-4).
+        feature_code: VCP feature code (e.g., 0x10 for brightness).
+
+    Returns:
+        Current feature value.
+
+    Raises:
+        DdcError: If libddcutil reports a failure. The bus handle is
+            closed on data errors so the next call reopens it.
+    """
+    lib = _require()
+    handle = _get_handle(bus)
+    response = _NonTableVcpValue()
+    _check('ddca_get_non_table_vcp_value',
+           lib.ddca_get_non_table_vcp_value(handle, feature_code, ctypes.byref(response)), bus)
+    return (response.sh << 8) | response.sl
+
+
+def set_vcp_value(bus: int, feature_code: int, value: int, verify: bool = False) -> None:
+    """
+    Write a non-table VCP feature value.
+
+    Args:
+        bus: I2C bus number (e.g., 4 for /dev/i2c-4).
+        feature_code: VCP feature code (e.g., 0x10 for brightness).
+        value: New feature value (0-65535).
+        verify: Read the value back after writing it.
+
+    Raises:
+        DdcError: If libddcutil reports a failure. The bus handle is
+            closed on data errors so the next call reopens it.
+    """
+    lib = _require()
+    handle = _get_handle(bus)
+    # The verify setting is per-thread in libddcutil, so set it on every call
+    lib.ddca_enable_verify(verify)
+    _check('ddca_set_non_table_vcp_value',
+           lib.ddca_set_non_table_vcp_value(handle, feature_code, (value >> 8) & 0xFF, value & 0xFF), bus)
@@ -11,10 +11,25 @@ import subprocess
 from dataclasses import dataclass
 from typing import List, Dict
 
+from ddcutil_wrapper import run_ddcutil
 
-@dataclass
+
+# Field prefixes in ddcutil detect output (after stripping indentation)
+_BUS_PREFIX = 'I2C bus:'
+_MFG_PREFIX = 'mfg id:'  # compared case-insensitively
+_MODEL_PREFIX = 'Model:'
+_SERIAL_PREFIX = 'Serial number:'
+
+# Validates the bus path on an "I2C bus:" line
+_BUS_PATH_PATTERN = re.compile(r'/dev/i2c-\d+')
+
+
+@dataclass(frozen=True)
 class Monitor:
-    """Represents a detected monitor with stable identification."""
+    """Represents a detected monitor with stable identification (immutable, hashable)."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('manufacturer', 'model', 'serial', 'i2c_bus', 'stable_id')
+
     manufacturer: str
     model: str
     serial: str
@@ -24,7 +39,7 @@ class Monitor:
     def __post_init__(self):
         """Generate stable ID if not provided."""
         if not self.stable_id:
-            self.stable_id = f"{self.manufacturer}-{self.model}-{self.serial}"
+            object.__setattr__(self, 'stable_id', f"{self.manufacturer}-{self.model}-{self.serial}")
 
 
 def detect_monitors() -> List[Monitor]:
@@ -38,8 +53,8 @@ def detect_monitors() -> List[Monitor]:
         RuntimeError: If ddcutil command fails.
     """
     try:
-        result = subprocess.run(
-            ['ddcutil', 'detect', "--sleep-multiplier", ".1"],
+        result = run_ddcutil(
+            ['detect', "--sleep-multiplier", ".1"],
             capture_output=True,
             text=True,
             timeout=30
@@ -74,64 +89,64 @@ def parse_ddcutil_detect(output: str) -> List[Monitor]:
     Returns:
         List of Monitor objects sorted by stable ID.
     """
-    monitors = []
+    parsed = []
     current_monitor = {}
 
-    # Pattern to match I2C bus: /dev/i2c-X
-    bus_pattern = re.compile(r'I2C bus:\s+(/dev/i2c-\d+)')
-    # Pattern to match manufacturer ID
-    mfg_pattern = re.compile(r'Mfg id:\s+(\w+)', re.IGNORECASE)
-    # Pattern to match model name
-    model_pattern = re.compile(r'Model:\s+(.+)')
-    # Pattern to match serial number
-    serial_pattern = re.compile(r'Serial number:\s+(.+)')
-
     for line in output.split('\n'):
         line = line.strip()
 
         # Check for I2C bus (indicates start of new monitor)
-        bus_match = bus_pattern.search(line)
-        if bus_match:
-            # Save previous monitor if complete
-            if _is_monitor_complete(current_monitor):
-                monitors.append(_create_monitor(current_monitor))
-            # Start new monitor
-            current_monitor = {'i2c_bus': bus_match.group(1)}
+        if line.startswith(_BUS_PREFIX):
+            bus_match = _BUS_PATH_PATTERN.match(line[len(_BUS_PREFIX):].lstrip())
+            if bus_match:
+                # Save previous monitor if complete
+                if _is_monitor_complete(current_monitor):
+                    parsed.append(current_monitor)
+                # Start new monitor
+                current_monitor = {'i2c_bus': bus_match.group(0)}
+            continue
+
+        if not current_monitor:
             continue
 
-        # Extract manufacturer
-        mfg_match = mfg_pattern.search(line)
-        if mfg_match and current_monitor:
-            current_monitor['manufacturer'] = mfg_match.group(1)
+        # Extract manufacturer (first word, e.g. "DEL" from "DEL - Dell Inc.")
+        if line[:len(_MFG_PREFIX)].lower() == _MFG_PREFIX:
+            words = line[len(_MFG_PREFIX):].split(None, 1)
+            if words:
+                current_monitor['manufacturer'] = words[0]
             continue
 
         # Extract model
-        model_match = model_pattern.search(line)
-        if model_match and current_monitor:
-            current_monitor['model'] = model_match.group(1).strip()
+        if line.startswith(_MODEL_PREFIX):
+            model = line[len(_MODEL_PREFIX):].strip()
+            if model:
+                current_monitor['model'] = model
             continue
 
         # Extract serial number
-        serial_match = serial_pattern.search(line)
-        if serial_match and current_monitor:
-            current_monitor['serial'] = serial_match.group(1).strip()
+        if line.startswith(_SERIAL_PREFIX):
+            serial = line[len(_SERIAL_PREFIX):].strip()
+            if serial:
+                current_monitor['serial'] = serial
             continue
 
     # Don't forget the last monitor
     if _is_monitor_complete(current_monitor):
-        monitors.append(_create_monitor(current_monitor))
+        parsed.append(current_monitor)
 
     # Sort by stable ID for consistent ordering
-    monitors.sort(key=lambda m: m.stable_id)
+    parsed.sort(key=_base_stable_id)
 
-    # Handle duplicate stable IDs by appending bus number
-    seen_ids = {}
-    for monitor in monitors:
-        if monitor.stable_id in seen_ids:
-            # Append bus number to make unique
-            bus_num = monitor.i2c_bus.split('-')[-1]
-            monitor.stable_id = f"{monitor.stable_id}-bus{bus_num}"
-        seen_ids[monitor.stable_id] = True
+    # Create monitors, appending the bus number to duplicate stable IDs
+    monitors = []
+    seen_ids = set()
+    for monitor_dict in parsed:
+        stable_id = _base_stable_id(monitor_dict)
+        if stable_id in seen_ids:
+            bus_num = monitor_dict['i2c_bus'].split('-')[-1]
+            stable_id = f"{stable_id}-bus{bus_num}"
+        seen_ids.add(stable_id)
+        monitors.append(_create_monitor(monitor_dict, stable_id))
 
     return monitors
 
@@ -142,14 +157,19 @@ def _is_monitor_complete(monitor_dict: Dict) -> bool:
     return all(key in monitor_dict for key in required)
 
 
-def _create_monitor(monitor_dict: Dict) -> Monitor:
+def _base_stable_id(monitor_dict: Dict) -> str:
+    """Return the stable ID for a parsed monitor, before de-duplication."""
+    return f"{monitor_dict['manufacturer']}-{monitor_dict['model']}-{monitor_dict['serial']}"
+
+
+def _create_monitor(monitor_dict: Dict, stable_id: str) -> Monitor:
     """Create Monitor object from parsed dictionary."""
     return Monitor(
         manufacturer=monitor_dict['manufacturer'],
         model=monitor_dict['model'],
         serial=monitor_dict['serial'],
         i2c_bus=monitor_dict['i2c_bus'],
-        stable_id=""  # Will be generated in __post_init__
+        stable_id=stable_id,
     )
 
 
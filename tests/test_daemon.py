@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for the brightness daemon's request handling."""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lib'))
+
+import daemon
+
+
+class FakeMonitor:
+    """Stands in for get_brightness/set_brightness with fixed I2C latencies."""
+
+    def __init__(self, brightness: int, read_delay: float, write_delay: float):
+        self.brightness = brightness
+        self.read_delay = read_delay
+        self.write_delay = write_delay
+        self.reads = 0
+        self.writes = []
+        self._lock = threading.Lock()
+
+    def get_brightness(self, i2c_bus, **kwargs):
+        time.sleep(self.read_delay)
+        with self._lock:
+            self.reads += 1
+            return self.brightness
+
+    def set_brightness(self, i2c_bus, value, **kwargs):
+        time.sleep(self.write_delay)
+        with self._lock:
+            self.brightness = value
+            self.writes.append(value)
+
+
+class StepBurstTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.socket_path = Path(tmp.name) / 'brightness.sock'
+
+        self.monitor = FakeMonitor(40, read_delay=0.08, write_delay=0.03)
+        for name in ('get_brightness', 'set_brightness'):
+            patcher = mock.patch.object(daemon, name, getattr(self.monitor, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _burst(self, commands, interval):
+        brightness_daemon = daemon.BrightnessDaemon(self.socket_path, coalesce_ms=80)
+
+        async def send(i, command):
+            await asyncio.sleep(i * interval)
+            return await brightness_daemon._dispatch(command.split())
+
+        return await asyncio.gather(*(send(i, command) for i, command in enumerate(commands)))
+
+    def test_burst_of_steps_applies_every_step(self):
+        replies = asyncio.run(self._burst(['STEP bus=4 delta=10'] * 5, interval=0.05))
+
+        self.assertEqual(replies, ['OK 50', 'OK 60', 'OK 70', 'OK 80', 'OK 90'])
+        self.assertEqual(self.monitor.brightness, 90)
+        self.assertEqual(self.monitor.reads, 1)
+
+    def test_simultaneous_steps_share_one_read(self):
+        replies = asyncio.run(self._burst(['STEP bus=4 delta=10', 'STEP bus=4 delta=-5'], interval=0))
+
+        self.assertEqual(replies, ['OK 50', 'OK 45'])
+        self.assertEqual(self.monitor.brightness, 45)
+        self.assertEqual(self.monitor.reads, 1)
+
+    def test_held_key_writes_during_the_hold(self):
+        self.monitor.brightness = 0
+        replies = asyncio.run(self._burst(['STEP bus=4 delta=5'] * 20, interval=0.05))
+
+        self.assertEqual(replies, [f"OK {5 * i}" for i in range(1, 21)])
+        self.assertEqual(self.monitor.brightness, 100)
+        # 1 s of 50 ms repeats against an 80 ms window (240 ms at most)
+        self.assertGreaterEqual(len(self.monitor.writes), 3)
+
+    def test_steps_clamp_at_limits(self):
+        self.monitor.brightness = 95
+        replies = asyncio.run(self._burst(['STEP bus=4 delta=10'] * 2, interval=0.01))
+
+        self.assertEqual(replies, ['OK 100', 'OK 100'])
+        self.assertEqual(self.monitor.writes, [100])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for the ddcutil wrapper's per-bus caches and stats."""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lib'))
+
+import ddcutil_wrapper
+from ddcutil_wrapper import BusStats, MonitorCache
+from monitor_detector import Monitor
+
+
+BUS = '/dev/i2c-4'
+
+
+class BusStatsPersistenceTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for name, value in (('CACHE_DIR', Path(tmp.name)), ('_bus_stats', {})):
+            patcher = mock.patch.object(ddcutil_wrapper, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run_process(self, latencies=(), failures=0) -> BusStats:
+        """Record like one short-lived CLI process would, then exit."""
+        stats = ddcutil_wrapper._get_bus_stats(BUS)
+        for _ in range(failures):
+            stats.record_failure()
+        for latency in latencies:
+            stats.record_success(latency)
+        ddcutil_wrapper._save_bus_stats()
+        ddcutil_wrapper._bus_stats.clear()
+        return stats
+
+    def test_next_process_starts_with_saved_latencies(self):
+        self._run_process([0.03, 0.04])
+
+        stats = BusStats(BUS)
+        self.assertEqual(list(stats.latencies), [0.03, 0.04])
+        self.assertEqual(stats.success_streak, 2)
+
+    def test_short_processes_relax_multiplier_after_failures(self):
+        self._run_process(failures=2)
+        self.assertAlmostEqual(BusStats(BUS).sleep_multiplier, 0.4)
+
+        for _ in range(12):
+            self._run_process([0.03, 0.03])
+
+        stats = BusStats(BUS)
+        self.assertLess(stats.sleep_multiplier, 0.4)
+        self.assertEqual(len(stats.latencies), 24)
+
+    def test_concurrent_instances_merge_samples(self):
+        first = BusStats(BUS)
+        second = BusStats(BUS)
+        first.record_success(0.01)
+        second.record_success(0.02)
+        first._save()
+        second._save()
+
+        stats = BusStats(BUS)
+        self.assertEqual(sorted(stats.latencies), [0.01, 0.02])
+        self.assertEqual(stats.success_streak, 2)
+
+
+class MonitorCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_file = Path(tmp.name) / 'bus-cache.bin'
+        patchers = [
+            mock.patch.object(ddcutil_wrapper, 'CACHE_FILE', self.cache_file),
+            mock.patch.object(MonitorCache, '_memo', None),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_round_trip_leaves_no_temp_files(self):
+        monitors = [Monitor('DEL', 'DELL U3419W', '9B6SWP2', '/dev/i2c-4', '')]
+        MonitorCache().set(monitors)
+        MonitorCache._memo = None
+
+        self.assertEqual(MonitorCache().get(), monitors)
+        self.assertEqual(list(self.cache_file.parent.iterdir()), [self.cache_file])
+
+    def test_oversized_field_is_not_cached(self):
+        monitors = [Monitor('DEL', 'x' * 70000, '9B6SWP2', '/dev/i2c-4', '')]
+        with mock.patch('builtins.print'):
+            MonitorCache().set(monitors)
+
+        self.assertIsNone(MonitorCache().get())
+
+
+class SleepMultiplierBackoffTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patchers = [
+            mock.patch.object(ddcutil_wrapper, 'CACHE_DIR', Path(tmp.name)),
+            mock.patch.object(ddcutil_wrapper, '_bus_stats', {}),
+            mock.patch.object(ddcutil_wrapper.libddcutil_ffi, 'is_available', return_value=False),
+            mock.patch.object(ddcutil_wrapper.time, 'sleep'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fail_getvcp(self, stderr: bytes) -> float:
+        failed = subprocess.CompletedProcess([], 1, stdout=b'', stderr=stderr)
+        with mock.patch.object(ddcutil_wrapper, 'run_ddcutil', return_value=failed):
+            with self.assertRaises(RuntimeError):
+                ddcutil_wrapper._read_brightness(BUS, max_retries=1)
+        return ddcutil_wrapper._get_bus_stats(BUS).sleep_multiplier
+
+    def test_transfer_error_backs_off(self):
+        multiplier = self._fail_getvcp(b'Error getting value: DDCRC_RETRIES(-3010): maximum retries exceeded')
+        self.assertAlmostEqual(multiplier, ddcutil_wrapper.DEFAULT_SLEEP_MULTIPLIER * 2)
+
+    def test_missing_display_does_not_back_off(self):
+        multiplier = self._fail_getvcp(b'Display not found')
+        self.assertAlmostEqual(multiplier, ddcutil_wrapper.DEFAULT_SLEEP_MULTIPLIER)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@ NC='\033[0m'
 
 BIN_DIR="$HOME/.local/bin"
 LIB_DIR="$HOME/.local/lib/brightness-control"
+SYSTEMD_DIR="$HOME/.config/systemd/user"
 
 echo -e "${BLUE}=== Brightness Control Uninstallation ===${NC}\n"
 
@@ -37,19 +38,32 @@ done <<< "$EXISTING"
 
 gsettings set org.gnome.settings-daemon.plugins.media-keys custom-keybindings "[$KEEP_LIST]"
 
+# --- Stop daemon ---
+if [ -f "$SYSTEMD_DIR/brightness-controld.service" ]; then
+    systemctl --user disable --now brightness-controld.service 2>/dev/null || true
+    rm "$SYSTEMD_DIR/brightness-controld.service"
+    systemctl --user daemon-reload 2>/dev/null || true
+    echo -e "${GREEN}✓${NC} Removed brightness-controld service"
+fi
+
 # --- Remove installed files ---
 if [ -f "$BIN_DIR/brightness-control" ]; then
     rm "$BIN_DIR/brightness-control"
     echo -e "${GREEN}✓${NC} Removed $BIN_DIR/brightness-control"
 fi
 
+if [ -f "$BIN_DIR/brightness-controld" ]; then
+    rm "$BIN_DIR/brightness-controld"
+    echo -e "${GREEN}✓${NC} Removed $BIN_DIR/brightness-controld"
+fi
+
 if [ -d "$LIB_DIR" ]; then
     rm -rf "$LIB_DIR"
     echo -e "${GREEN}✓${NC} Removed $LIB_DIR"
 fi
 
 # --- Remove cache ---
-CACHE_FILE="/tmp/brightness-control-$USER-bus-cache.json"
+CACHE_FILE="/tmp/brightness-control-$USER-bus-cache.bin"
 if [ -f "$CACHE_FILE" ]; then
     rm "$CACHE_FILE"
     echo -e "${GREEN}✓${NC} Removed cache file"